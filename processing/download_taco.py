@@ -0,0 +1,350 @@
+"""
+Download the TACO dataset and convert it to YOLO format.
+
+Usage:
+    python download_taco.py         # First run: downloads the TACO repo (annotations)
+    python download_taco_images.py  # Downloads the actual images (~15GB)
+    python download_taco.py         # Second run: converts everything to YOLO format
+"""
+
+import argparse
+import concurrent.futures
+import json
+import os
+import pickle
+import shutil
+import time
+import zipfile
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from tqdm import tqdm
+from urllib3.util.retry import Retry
+
+# orjson parses the big COCO annotations file 2-6x faster than the stdlib.
+# Fall back to the stdlib json module if it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson stream-parses the annotations without materializing the whole
+# JSON tree, keeping peak memory at just the fields we actually use
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# speedcopy patches shutil.copyfile to use reflinks / server-side copy
+# (copy_file_range, CIFS ioctl, CopyFile2) so image staging skips the
+# userspace read/write round-trip when the filesystem supports it.
+try:
+    import speedcopy
+
+    speedcopy.patch_copyfile()
+except ImportError:
+    pass
+
+TACO_URL = "https://github.com/pedropro/TACO/archive/refs/heads/master.zip"
+DATA_DIR = Path(__file__).parent / "dataset"
+TACO_DIR = DATA_DIR / "TACO-master"
+
+
+def make_session(pool_size=16):
+    """Build a requests.Session with keep-alive pooling and bounded retries.
+
+    Connection reuse skips the TCP+TLS handshake on retries, range
+    resumes, and the thousands of image fetches; transient HTTP errors
+    are retried with backoff inside urllib3.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_session = make_session()
+
+
+def download_file(url, destination, retries=5):
+    """Stream a file from url to destination, resuming partial files and retrying on network errors."""
+    for attempt in range(retries):
+        try:
+            # Resume from however much of the file we already have
+            resume_pos = destination.stat().st_size if destination.exists() else 0
+            headers = {"Range": f"bytes={resume_pos}-"} if resume_pos else {}
+            response = _session.get(url, stream=True, headers=headers)
+            if resume_pos and response.status_code == 416:
+                # Requested range past EOF: the file is already complete
+                return
+            if resume_pos and response.status_code != 206:
+                # Server ignored the Range header, start from scratch
+                resume_pos = 0
+            response.raise_for_status()
+            total_size = int(response.headers.get("content-length", 0)) + resume_pos
+
+            # Big chunks and a big write buffer keep the per-chunk Python/urllib3
+            # overhead low on fast links; the progress bar only refreshes every 16MB.
+            mode = "ab" if resume_pos else "wb"
+            with open(destination, mode, buffering=8 * 1024 * 1024) as f:
+                with tqdm(
+                    total=total_size, initial=resume_pos, unit="B", unit_scale=True, desc=destination.name
+                ) as progress_bar:
+                    pending = 0
+                    for chunk in response.iter_content(chunk_size=4 * 1024 * 1024):
+                        pending += f.write(chunk)
+                        if pending >= 16 * 1024 * 1024:
+                            progress_bar.update(pending)
+                            pending = 0
+                    if pending:
+                        progress_bar.update(pending)
+            return
+        except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError):
+            if attempt == retries - 1:
+                raise
+            wait = 2**attempt
+            print(f"Download interrupted, retrying in {wait}s...")
+            time.sleep(wait)
+
+
+def download_taco():
+    """Download and extract the TACO repository (annotations only, no images)."""
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+    if TACO_DIR.exists():
+        print(f"TACO repository already at {TACO_DIR}")
+        return
+
+    zip_path = DATA_DIR / "taco.zip"
+    print("Downloading TACO repository...")
+    download_file(TACO_URL, zip_path)
+
+    print("Extracting...")
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        zf.extractall(DATA_DIR)
+    zip_path.unlink()
+    print(f"TACO repository extracted to {TACO_DIR}")
+
+
+def convert_coco_to_yolo(bboxes, img_width, img_height):
+    """Convert an (N, 4) array of COCO [x, y, w, h] bboxes to normalized YOLO [cx, cy, w, h]."""
+    bboxes = np.asarray(bboxes, dtype=np.float32)
+    yolo = np.empty_like(bboxes)
+    yolo[:, 0] = (bboxes[:, 0] + bboxes[:, 2] / 2) / img_width
+    yolo[:, 1] = (bboxes[:, 1] + bboxes[:, 3] / 2) / img_height
+    yolo[:, 2] = bboxes[:, 2] / img_width
+    yolo[:, 3] = bboxes[:, 3] / img_height
+    return yolo
+
+
+def _stream_coco_data(annotations_file):
+    """Stream-parse just the COCO sections the pipeline uses via ijson.
+
+    Only image ids/sizes/urls, annotation bboxes/ids and the categories
+    list are kept, so resident memory stays far below a full json.load
+    of the file.
+    """
+    coco_data = {"images": [], "annotations": [], "categories": []}
+    with open(annotations_file, "rb") as f:
+        for ann in ijson.items(f, "annotations.item"):
+            coco_data["annotations"].append(
+                {
+                    "image_id": ann["image_id"],
+                    "category_id": ann["category_id"],
+                    "bbox": [float(v) for v in ann["bbox"]],
+                }
+            )
+    with open(annotations_file, "rb") as f:
+        for img in ijson.items(f, "images.item"):
+            coco_data["images"].append(
+                {
+                    "id": img["id"],
+                    "file_name": img["file_name"],
+                    "width": img["width"],
+                    "height": img["height"],
+                    "flickr_url": img.get("flickr_url"),
+                    "coco_url": img.get("coco_url"),
+                }
+            )
+    with open(annotations_file, "rb") as f:
+        coco_data["categories"] = [
+            {"id": cat["id"], "name": cat["name"]} for cat in ijson.items(f, "categories.item")
+        ]
+    return coco_data
+
+
+def load_coco_data(annotations_file):
+    """Parse the COCO annotations, caching the result in a pickle sidecar.
+
+    Reruns of the pipeline load the cached pickle (much faster than
+    re-parsing the JSON); the cache is rebuilt whenever annotations.json
+    is newer than it.
+    """
+    cache_file = annotations_file.with_suffix(".pkl")
+    if cache_file.exists() and cache_file.stat().st_mtime >= annotations_file.stat().st_mtime:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+
+    if ijson is not None:
+        coco_data = _stream_coco_data(annotations_file)
+    elif orjson is not None:
+        with open(annotations_file, "rb") as f:
+            coco_data = orjson.loads(f.read())
+    else:
+        with open(annotations_file, "r") as f:
+            coco_data = json.load(f)
+
+    with open(cache_file, "wb") as f:
+        pickle.dump(coco_data, f, protocol=5)
+    return coco_data
+
+
+def prepare_taco_yolo(link_mode="copy"):
+    """Convert the TACO COCO annotations into a YOLO dataset under dataset/.
+
+    link_mode picks how images are staged: "copy" duplicates them,
+    "symlink"/"hardlink" just point at the TACO originals so no image
+    bytes are duplicated on disk (Ultralytics reads through links fine).
+    """
+    annotations_file = TACO_DIR / "data" / "annotations.json"
+    if not annotations_file.exists():
+        print(f"Error: {annotations_file} not found. Run download_taco.py first.")
+        return
+
+    print("Loading annotations...")
+    coco_data = load_coco_data(annotations_file)
+
+    # Columnar image metadata: one structured array instead of thousands
+    # of per-image dicts, so the hot loop below reads C arrays rather
+    # than doing four hash lookups per image
+    images = np.array(
+        [(img["id"], img["file_name"], img["width"], img["height"]) for img in coco_data["images"]],
+        dtype=[("id", "i4"), ("fname", "U256"), ("w", "i4"), ("h", "i4")],
+    )
+
+    # Map every image id to its list of annotations; the defaultdict hands
+    # back an empty list for images with no annotations
+    img_to_anns = defaultdict(list)
+    for ann in coco_data["annotations"]:
+        img_to_anns[ann["image_id"]].append(ann)
+
+    # TACO category ids are not contiguous, remap them to 0..N-1 for YOLO
+    categories = coco_data["categories"]
+    cat_id_to_idx = {cat["id"]: idx for idx, cat in enumerate(categories)}
+
+    # One walk of the TACO data tree replaces a stat() syscall per image
+    # when checking which files actually made it down
+    taco_data = TACO_DIR / "data"
+    existing_files = set()
+    for root, _dirs, files in os.walk(taco_data):
+        rel = Path(root).relative_to(taco_data)
+        for name in files:
+            existing_files.add(str(rel / name))
+
+    # 80/20 train/val split
+    shuffled = np.random.default_rng(42).permutation(images)
+    split_idx = int(len(shuffled) * 0.8)
+    splits = {
+        "train": shuffled[:split_idx],
+        "val": shuffled[split_idx:],
+    }
+
+    def process_split(split_name, split_imgs):
+        img_dir = DATA_DIR / "images" / split_name
+        label_dir = DATA_DIR / "labels" / split_name
+        img_dir.mkdir(parents=True, exist_ok=True)
+        label_dir.mkdir(parents=True, exist_ok=True)
+
+        # Collect the work up front so the I/O can run in parallel below
+        copy_tasks = []
+        for img_id, fname, img_w, img_h in split_imgs:
+            if fname not in existing_files:
+                continue
+            img_id = int(img_id)
+            src_img = taco_data / fname
+            dest_img = img_dir / f"{img_id}.jpg"
+            copy_tasks.append((src_img, dest_img, img_id, int(img_w), int(img_h)))
+
+        def stage_image(src_img, dest_img):
+            if dest_img.exists() or dest_img.is_symlink():
+                dest_img.unlink()
+            if link_mode == "symlink":
+                dest_img.symlink_to(src_img.resolve())
+            elif link_mode == "hardlink":
+                os.link(src_img, dest_img)
+            else:
+                shutil.copy2(src_img, dest_img)
+
+        def write_label(img_id, img_w, img_h):
+            label_path = label_dir / f"{img_id}.txt"
+            anns = img_to_anns[img_id]
+            if not anns:
+                # Empty label file = background image for YOLO
+                label_path.write_bytes(b"")
+                return
+            cat_ids = [cat_id_to_idx[ann["category_id"]] for ann in anns]
+            bboxes = [ann["bbox"] for ann in anns]
+            yolo = convert_coco_to_yolo(bboxes, img_w, img_h)
+            # %-format straight to bytes: no str(float) shortest-roundtrip
+            # repr, no UTF-8 re-encode, and one filesystem write per file;
+            # the Ultralytics loader needs loose .txt labels, so fusing
+            # them into one archive isn't an option
+            buf = b"".join(
+                b"%d %.6f %.6f %.6f %.6f\n" % (cat_id, *row)
+                for cat_id, row in zip(cat_ids, yolo.tolist())
+            )
+            label_path.write_bytes(buf)
+
+        # File copies are I/O bound, so a thread pool overlaps the syscalls
+        with concurrent.futures.ThreadPoolExecutor(max_workers=15) as ex:
+            copies = ex.map(lambda t: stage_image(t[0], t[1]), copy_tasks)
+            list(tqdm(copies, total=len(copy_tasks), desc=f"Staging {split_name} images"))
+            labels = ex.map(lambda t: write_label(t[2], t[3], t[4]), copy_tasks)
+            list(tqdm(labels, total=len(copy_tasks), desc=f"Writing {split_name} labels"))
+
+        print(f"{split_name}: {len(copy_tasks)}/{len(split_imgs)} images")
+
+    for split_name, split_imgs in splits.items():
+        process_split(split_name, split_imgs)
+
+    # Write the dataset config for YOLO training
+    yaml_path = Path(__file__).parent / "data.yaml"
+    with open(yaml_path, "w") as f:
+        f.write(f"path: {DATA_DIR}\n")
+        f.write("train: images/train\n")
+        f.write("val: images/val\n")
+        f.write("names:\n")
+        for idx, cat in enumerate(categories):
+            f.write(f"  {idx}: {cat['name']}\n")
+    print(f"Dataset config written to {yaml_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Download TACO and convert it to YOLO format")
+    parser.add_argument(
+        "--link-mode",
+        choices=["copy", "symlink", "hardlink"],
+        default="copy",
+        help="how to stage images into dataset/ (symlink/hardlink avoid duplicating ~15GB)",
+    )
+    args = parser.parse_args()
+
+    download_taco()
+
+    # Only convert if the images have been downloaded already
+    if any((TACO_DIR / "data").glob("batch_*")):
+        prepare_taco_yolo(link_mode=args.link_mode)
+    else:
+        print("No images found. Run download_taco_images.py, then run this script again.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Download the TACO dataset images (~15GB).
+
+Reads the image URLs straight from the TACO annotations and fans the
+downloads out across a thread pool. Run download_taco.py first to fetch
+the annotations. Safe to rerun: images already on disk are skipped.
+"""
+
+import concurrent.futures
+
+import requests
+from tqdm import tqdm
+
+from download_taco import TACO_DIR, load_coco_data, make_session
+
+MAX_WORKERS = 32
+
+
+def download_image(session, url, dest):
+    """Download one image, skipping files that are already present."""
+    if dest.exists() and dest.stat().st_size > 0:
+        return
+    response = session.get(url, timeout=60)
+    response.raise_for_status()
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    dest.write_bytes(response.content)
+
+
+def download_taco_images():
+    annotations_file = TACO_DIR / "data" / "annotations.json"
+    if not annotations_file.exists():
+        print(f"Error: {annotations_file} not found. Run download_taco.py first.")
+        return
+
+    coco_data = load_coco_data(annotations_file)
+
+    tasks = []
+    for img in coco_data["images"]:
+        url = img.get("flickr_url") or img.get("coco_url")
+        if url:
+            tasks.append((url, TACO_DIR / "data" / img["file_name"]))
+
+    print(f"Downloading {len(tasks)} images with {MAX_WORKERS} workers...")
+    failed = 0
+    with make_session(pool_size=MAX_WORKERS) as session:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+            futures = [ex.submit(download_image, session, url, dest) for url, dest in tasks]
+            for future in tqdm(concurrent.futures.as_completed(futures), total=len(futures), desc="Images"):
+                try:
+                    future.result()
+                except requests.exceptions.RequestException:
+                    failed += 1
+
+    if failed:
+        print(f"{failed} images failed to download. Rerun this script to retry them.")
+    else:
+        print("All images downloaded.")
+
+
+if __name__ == "__main__":
+    download_taco_images()
@@ -0,0 +1,214 @@
+"""
+Standalone garbage detector built on the trained TACO YOLOv8 model.
+
+Usage:
+    python garbage_detector.py --show-classes
+    python garbage_detector.py --image test.jpg
+    python garbage_detector.py --dir test_images/
+    python garbage_detector.py --model yolov8n.pt --image test.jpg
+    python garbage_detector.py --image test.jpg --conf 0.15
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import cv2
+import numpy as np
+from ultralytics import YOLO
+
+DEFAULT_MODEL = Path(__file__).parent / "runs" / "detect" / "train8" / "weights" / "best.pt"
+IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".bmp"}
+BATCH_SIZE = 16
+IMGSZ = 416
+
+
+class GarbageDetector:
+    def __init__(self, model_path=DEFAULT_MODEL, confidence_threshold=0.4):
+        model_path = Path(model_path)
+        # Prefer an INT8 TensorRT engine exported next to the weights
+        # (see --export-int8); it runs the same detections much faster
+        engine_path = model_path.with_suffix(".engine")
+        if model_path.suffix == ".pt" and engine_path.exists():
+            model_path = engine_path
+        # Engines are built with static [BATCH_SIZE,3,IMGSZ,IMGSZ] shapes,
+        # so batch inputs get letterboxed to exactly that size up front
+        self.is_engine = model_path.suffix == ".engine"
+        self.model = YOLO(str(model_path))
+        self.confidence_threshold = confidence_threshold
+        # JPEG-encoding annotated frames blocks inference, so writes go
+        # through a small background pool and are awaited before returning
+        self._writer = ThreadPoolExecutor(max_workers=2)
+        self._pending_writes = []
+
+    def show_classes(self):
+        """Print every class the loaded model can detect."""
+        print(f"{len(self.model.names)} garbage classes:")
+        for idx, name in self.model.names.items():
+            print(f"  {idx}: {name}")
+
+    def detect_garbage(self, image_path, save_output=True):
+        """Detect garbage in a single image. Returns [(class_name, confidence), ...]."""
+        if self.is_engine:
+            # The engine only accepts full [BATCH_SIZE,3,IMGSZ,IMGSZ]
+            # batches, so pad the single image up to the compiled shape
+            img = cv2.imread(str(image_path))
+            if img is None:
+                print(f"Could not read {image_path}")
+                return []
+            batch = self._pad_batch([self._letterbox(img)])
+            results = self.model(batch, conf=self.confidence_threshold)
+        else:
+            results = self.model(image_path, conf=self.confidence_threshold)
+        detections = self._handle_result(results[0], Path(image_path), save_output)
+        self._flush_writes()
+        return detections
+
+    def detect_batch(self, image_dir, save_output=True):
+        """Detect garbage in every image in a directory. Returns {filename: detections}."""
+        image_files = sorted(p for p in Path(image_dir).iterdir() if p.suffix.lower() in IMAGE_EXTS)
+        if not image_files:
+            print(f"No images found in {image_dir}")
+            return {}
+
+        # Feed the model a list per chunk so it runs one batched forward
+        # pass instead of a batch-1 pass per image. Decoding the JPEGs is
+        # CPU-bound, so a small thread pool pre-decodes each chunk instead
+        # of leaving it to the inference loop.
+        all_detections = {}
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            for start in range(0, len(image_files), BATCH_SIZE):
+                chunk = image_files[start : start + BATCH_SIZE]
+                decoded = list(ex.map(lambda p: cv2.imread(str(p)), chunk))
+                loaded = [(p, img) for p, img in zip(chunk, decoded) if img is not None]
+                if not loaded:
+                    continue
+                batch = [img for _, img in loaded]
+                if self.is_engine:
+                    # Static engines hard-assert the compiled shape, so
+                    # letterbox every image and pad short chunks (like the
+                    # last one) up to BATCH_SIZE; the zip below drops the
+                    # padding results again
+                    batch = self._pad_batch([self._letterbox(img) for img in batch])
+                results = self.model(batch, conf=self.confidence_threshold)
+                for (image_path, _), result in zip(loaded, results):
+                    all_detections[image_path.name] = self._handle_result(result, image_path, save_output)
+
+        self._flush_writes()
+        total = sum(len(d) for d in all_detections.values())
+        print(f"{total} detections across {len(image_files)} images")
+        return all_detections
+
+    def _handle_result(self, result, image_path, save_output):
+        detections = []
+        for box in result.boxes:
+            class_id = int(box.cls[0])
+            confidence = float(box.conf[0])
+            detections.append((self.model.names[class_id], confidence))
+            print(f"{image_path.name}: {self.model.names[class_id]} ({confidence:.2f})")
+
+        if save_output and detections:
+            annotated = result.plot()
+            output_file = image_path.with_name(f"result_{image_path.name}")
+            self._pending_writes.append(
+                self._writer.submit(cv2.imwrite, str(output_file), annotated, [cv2.IMWRITE_JPEG_QUALITY, 90])
+            )
+            print(f"Saving {output_file}")
+        return detections
+
+    def _pad_batch(self, imgs):
+        """Pad a list of letterboxed images up to the engine's static batch size."""
+        blank = np.full((IMGSZ, IMGSZ, 3), 114, dtype=np.uint8)
+        return imgs + [blank] * (BATCH_SIZE - len(imgs))
+
+    def _letterbox(self, img):
+        """Scale and pad an image to the engine's static IMGSZ x IMGSZ input."""
+        h, w = img.shape[:2]
+        scale = min(IMGSZ / h, IMGSZ / w)
+        nh, nw = round(h * scale), round(w * scale)
+        canvas = np.full((IMGSZ, IMGSZ, 3), 114, dtype=np.uint8)
+        top = (IMGSZ - nh) // 2
+        left = (IMGSZ - nw) // 2
+        canvas[top : top + nh, left : left + nw] = cv2.resize(img, (nw, nh))
+        return canvas
+
+    def _flush_writes(self):
+        """Wait for queued annotated-image writes to hit disk."""
+        for future in self._pending_writes:
+            future.result()
+        self._pending_writes.clear()
+
+
+def export_engine(model_path, int8=False):
+    """One-time TensorRT export with static [BATCH_SIZE,3,IMGSZ,IMGSZ] shapes.
+
+    Static shapes let TensorRT skip dynamic-shape dispatch and pick fused
+    single-path kernels at build time. FP16 by default; INT8 calibrates
+    against the TACO data.yaml.
+    """
+    model = YOLO(str(model_path))
+    kwargs = dict(format="engine", imgsz=IMGSZ, dynamic=False, batch=BATCH_SIZE, workspace=4)
+    if int8:
+        kwargs.update(int8=True, data=str(Path(__file__).parent / "data.yaml"))
+    else:
+        kwargs.update(half=True)
+    exported = model.export(**kwargs)
+    print(f"Exported TensorRT engine to {exported}")
+
+
+def export_int8(model_path, fmt="engine"):
+    """One-time INT8 export of the trained weights.
+
+    fmt="engine" builds a static-shape TensorRT engine for NVIDIA GPUs;
+    fmt="openvino" builds an OpenVINO IR that uses VNNI INT8 kernels on
+    Intel CPUs. Calibration runs against the TACO data.yaml.
+    """
+    if fmt == "engine":
+        export_engine(model_path, int8=True)
+        return
+    data_yaml = Path(__file__).parent / "data.yaml"
+    model = YOLO(str(model_path))
+    exported = model.export(format=fmt, int8=True, data=str(data_yaml), imgsz=IMGSZ)
+    print(f"Exported INT8 model to {exported}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Detect garbage in images with the trained TACO model")
+    parser.add_argument("--model", default=str(DEFAULT_MODEL), help="path to model weights")
+    parser.add_argument("--conf", type=float, default=0.4, help="confidence threshold")
+    parser.add_argument("--show-classes", action="store_true", help="list the model's classes and exit")
+    parser.add_argument("--image", help="detect garbage in a single image")
+    parser.add_argument("--dir", help="detect garbage in every image in a directory")
+    parser.add_argument(
+        "--export-int8",
+        choices=["engine", "openvino"],
+        help="export the model weights to an INT8 TensorRT engine or OpenVINO IR and exit",
+    )
+    parser.add_argument(
+        "--export-engine",
+        action="store_true",
+        help="export the model weights to an FP16 static-shape TensorRT engine and exit",
+    )
+    args = parser.parse_args()
+
+    if args.export_int8:
+        export_int8(args.model, args.export_int8)
+        return
+    if args.export_engine:
+        export_engine(args.model)
+        return
+
+    detector = GarbageDetector(model_path=args.model, confidence_threshold=args.conf)
+
+    if args.show_classes:
+        detector.show_classes()
+    elif args.image:
+        detector.detect_garbage(args.image)
+    elif args.dir:
+        detector.detect_batch(args.dir)
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
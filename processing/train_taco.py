@@ -0,0 +1,78 @@
+"""
+Train the litter detection model on the TACO dataset.
+
+Run download_taco.py / download_taco_images.py first to build the YOLO
+dataset and data.yaml. Trained weights land under runs/detect/.
+"""
+
+import argparse
+import os
+from pathlib import Path
+
+from ultralytics import YOLO
+
+DATA_YAML = Path(__file__).parent / "data.yaml"
+
+
+def train_model(model_name="yolov8s.pt", epochs=50, imgsz=640, batch=6, cache="disk", workers=None, rect_mode=True):
+    """Train YOLOv8 on the TACO dataset and return the training results."""
+    if workers is None:
+        # The GPU starves the dataloader at these image sizes, so scale
+        # workers with the machine instead of hardcoding a small number
+        workers = min(os.cpu_count() or 8, 16)
+
+    # rect=True and mosaic conflict: mosaic stitches arbitrary shapes, which
+    # forces the loader to re-letterbox every sample and defeats the uniform
+    # batch dims that let cuDNN pick its fast algorithms. Run either
+    # rectangular batches without mosaic, or mosaic without rect.
+    if rect_mode:
+        aug = dict(rect=True, mosaic=0.0, close_mosaic=0)
+    else:
+        aug = dict(rect=False, mosaic=0.5, close_mosaic=15)
+
+    yolo_model = YOLO(model_name)
+    results = yolo_model.train(
+        data=str(DATA_YAML),
+        epochs=epochs,
+        imgsz=imgsz,
+        batch=batch,
+        # cache='disk' decodes every JPEG once and reuses the tensors each
+        # epoch; cache='ram' keeps them in memory when it fits
+        cache=cache,
+        workers=workers,
+        **aug,
+    )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the TACO litter detection model")
+    parser.add_argument("--model", default="yolov8s.pt", help="base model weights to start from")
+    parser.add_argument("--epochs", type=int, default=50)
+    parser.add_argument("--imgsz", type=int, default=640, help="training image size")
+    parser.add_argument("--batch", type=int, default=6)
+    parser.add_argument("--cache", action="store_true", help="cache decoded images in RAM instead of on disk")
+    parser.add_argument(
+        "--rect",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="rectangular batches without mosaic (--no-rect for mosaic=0.5 instead)",
+    )
+    args = parser.parse_args()
+
+    if not DATA_YAML.exists():
+        print(f"Error: {DATA_YAML} not found. Run download_taco.py first.")
+        return
+
+    train_model(
+        model_name=args.model,
+        epochs=args.epochs,
+        imgsz=args.imgsz,
+        batch=args.batch,
+        cache="ram" if args.cache else "disk",
+        rect_mode=args.rect,
+    )
+
+
+if __name__ == "__main__":
+    main()